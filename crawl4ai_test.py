@@ -5,7 +5,6 @@ Test script to explore the CrawlResult object from crawl4ai.
 
 import asyncio
 from crawl4ai import AsyncWebCrawler
-import inspect
 
 async def test_crawl4ai():
     """Test crawl4ai and explore the CrawlResult object."""
@@ -15,42 +14,48 @@ async def test_crawl4ai():
         # Set some options
         crawler.timeout = 30
         crawler.javascript = True
-        crawler.wait_for = 5
         
-        # Crawl a simple URL
-        result = await crawler.arun(url="https://example.com")
+        # Crawl a simple URL; return once the DOM is ready instead of a fixed wait
+        result = await crawler.arun(
+            url="https://example.com",
+            wait_until="domcontentloaded",
+            delay_before_return_html=1.0
+        )
         
         # Print the type of the result
         print(f"Result type: {type(result)}")
         
+        # Collect the public attributes once (skip private attributes)
+        attrs = sorted(a for a in dir(result) if not a.startswith('_'))
+        attr_set = set(attrs)
+        
         # Print all attributes of the result
         print("\nAttributes:")
-        for attr in dir(result):
-            if not attr.startswith('_'):  # Skip private attributes
-                try:
-                    value = getattr(result, attr)
-                    # If it's a method, skip it
-                    if not inspect.ismethod(value):
-                        print(f"  {attr}: {type(value)}")
-                        # If it's a string, print a preview
-                        if isinstance(value, str) and value:
-                            preview = value[:100] + "..." if len(value) > 100 else value
-                            print(f"    Preview: {preview}")
-                except Exception as e:
-                    print(f"  {attr}: Error accessing - {e}")
+        for attr in attrs:
+            try:
+                value = getattr(result, attr)
+                # If it's a method, skip it
+                if not (callable(value) and not isinstance(value, (str, bytes))):
+                    print(f"  {attr}: {type(value)}")
+                    # If it's a string, print a preview
+                    if isinstance(value, str) and value:
+                        preview = value[:100] + "..." if len(value) > 100 else value
+                        print(f"    Preview: {preview}")
+            except Exception as e:
+                print(f"  {attr}: Error accessing - {e}")
         
         # Try to access specific attributes mentioned in the error
         print("\nSpecific attributes:")
         try:
-            print(f"  result.content exists: {'content' in dir(result)}")
-            if 'content' in dir(result):
+            print(f"  result.content exists: {'content' in attr_set}")
+            if 'content' in attr_set:
                 print(f"  result.content: {result.content[:100]}...")
         except Exception as e:
             print(f"  Error accessing result.content: {e}")
             
         try:
-            print(f"  result.text exists: {'text' in dir(result)}")
-            if 'text' in dir(result):
+            print(f"  result.text exists: {'text' in attr_set}")
+            if 'text' in attr_set:
                 print(f"  result.text: {result.text[:100]}...")
         except Exception as e:
             print(f"  Error accessing result.text: {e}")
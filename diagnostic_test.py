@@ -29,7 +29,7 @@ def test_imports():
             from confluence_scraper import RobustCrawler
             logger.info("✅ Direct import successful")
         except ImportError as e:
-            logger.error(f"❌ Direct import failed: {e}")
+            logger.error("❌ Direct import failed: %s", e)
             
         # Test src-prefixed import (as in cli.py)
         logger.debug("Attempting src-prefixed import: from src.confluence_scraper import RobustCrawler")
@@ -37,10 +37,10 @@ def test_imports():
             from src.confluence_scraper import RobustCrawler
             logger.info("✅ src-prefixed import successful")
         except ImportError as e:
-            logger.error(f"❌ src-prefixed import failed: {e}")
+            logger.error("❌ src-prefixed import failed: %s", e)
     
     except Exception as e:
-        logger.error(f"Unexpected error during import tests: {e}")
+        logger.error("Unexpected error during import tests: %s", e)
 
 def test_confluence_detection():
     """Test Confluence URL detection logic"""
@@ -53,6 +53,7 @@ def test_confluence_detection():
         # Try to import the crawler module
         try:
             from src.crawler import Crawler
+            from src.url_patterns import is_confluence
             
             # Create a minimal args object
             class Args:
@@ -75,24 +76,24 @@ def test_confluence_detection():
             
             # Test each URL
             for url in test_urls:
-                is_confluence = crawler.is_confluence_url(url)
-                logger.info(f"URL: {url} -> Detected as Confluence: {is_confluence}")
+                crawler_detection = crawler.is_confluence_url(url)
+                logger.info("URL: %s -> Detected as Confluence: %s", url, crawler_detection)
                 
                 # Also test CLI detection logic
-                cli_detection = 'confluence' in url.lower() or 'atlassian.net' in url.lower()
-                logger.info(f"URL: {url} -> CLI detection: {cli_detection}")
+                cli_detection = is_confluence(url)
+                logger.info("URL: %s -> CLI detection: %s", url, cli_detection)
                 
                 # Check for inconsistency
-                if is_confluence != cli_detection:
-                    logger.warning(f"❌ Inconsistent detection for {url}: crawler={is_confluence}, cli={cli_detection}")
+                if crawler_detection != cli_detection:
+                    logger.warning("❌ Inconsistent detection for %s: crawler=%s, cli=%s", url, crawler_detection, cli_detection)
                 else:
-                    logger.info(f"✅ Consistent detection for {url}")
+                    logger.info("✅ Consistent detection for %s", url)
                     
         except ImportError as e:
-            logger.error(f"Could not import Crawler: {e}")
+            logger.error("Could not import Crawler: %s", e)
             
     except Exception as e:
-        logger.error(f"Unexpected error during Confluence detection tests: {e}")
+        logger.error("Unexpected error during Confluence detection tests: %s", e)
 
 def test_page_id_extraction():
     """Test Confluence page ID extraction"""
@@ -127,39 +128,40 @@ def test_page_id_extraction():
             # Test each URL
             for url in test_urls:
                 page_id = crawler._extract_page_id(url)
-                logger.info(f"URL: {url} -> Extracted page ID: {page_id}")
+                logger.info("URL: %s -> Extracted page ID: %s", url, page_id)
                 
                 if not page_id:
-                    logger.warning(f"❌ Failed to extract page ID from {url}")
+                    logger.warning("❌ Failed to extract page ID from %s", url)
                 else:
-                    logger.info(f"✅ Successfully extracted page ID: {page_id}")
+                    logger.info("✅ Successfully extracted page ID: %s", page_id)
                     
         except ImportError as e:
-            logger.error(f"Could not import RobustCrawler: {e}")
+            logger.error("Could not import RobustCrawler: %s", e)
             
     except Exception as e:
-        logger.error(f"Unexpected error during page ID extraction tests: {e}")
+        logger.error("Unexpected error during page ID extraction tests: %s", e)
 
 def test_entry_point():
     """Test the entry point configuration"""
     logger.info("Testing entry point configuration...")
     
     try:
-        # Check the setup.py file
-        with open("setup.py", "r") as f:
-            setup_content = f.read()
+        # Check the pyproject.toml file
+        with open("pyproject.toml", "r") as f:
+            project_content = f.read()
             
-        # Look for the entry point definition
-        if "scrapemd=cli:main_cli" in setup_content:
-            logger.warning("❌ Entry point may be incorrect: 'scrapemd=cli:main_cli'")
-            logger.warning("   Should likely be: 'scrapemd=src.cli:main_cli'")
-        elif "scrapemd=src.cli:main_cli" in setup_content:
-            logger.info("✅ Entry point appears correct: 'scrapemd=src.cli:main_cli'")
+        # Look for the entry point definition; src/ modules are installed
+        # as top-level modules, so the entry point is the bare module name
+        if 'scrapemd = "cli:main_cli"' in project_content:
+            logger.info("✅ Entry point appears correct: 'scrapemd = \"cli:main_cli\"'")
+        elif 'scrapemd = "src.cli:main_cli"' in project_content:
+            logger.warning("❌ Entry point may be incorrect: 'scrapemd = \"src.cli:main_cli\"'")
+            logger.warning("   src/ modules use bare imports; should likely be: 'scrapemd = \"cli:main_cli\"'")
         else:
             logger.warning("❓ Could not find expected entry point pattern")
             
     except Exception as e:
-        logger.error(f"Unexpected error during entry point test: {e}")
+        logger.error("Unexpected error during entry point test: %s", e)
 
 if __name__ == "__main__":
     logger.info("Starting diagnostic tests...")
@@ -6,55 +6,14 @@ A command-line application that takes a URL as input, scrapes the content
 of the webpage, and converts it into a markdown file.
 """
 
-import argparse
-import asyncio
-import logging
+import os
 import sys
-from urllib.parse import urlparse
 
-# Import local modules
-from src.cli import parse_arguments
-from src.crawler import Crawler
-from src.processor import ContentProcessor
-from src.file_manager import FileManager
-from src.error_handler import setup_logging, handle_exception
+# The modules in src/ import each other by bare name, as they are installed
+# as top-level modules; make them importable when running from a checkout
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-async def main():
-    """Main entry point for the web scraper application."""
-    # Set up logging
-    setup_logging()
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Parse command line arguments
-        args = parse_arguments()
-        
-        logger.info(f"Starting scrape of {args.url}")
-        
-        # Initialize components
-        crawler = Crawler(args)
-        processor = ContentProcessor()
-        file_manager = FileManager(args.output if hasattr(args, 'output') else None)
-        
-        # Crawl the URL
-        result = await crawler.crawl(args.url)
-        
-        # Process the content
-        markdown_content = processor.process(result)
-        
-        # Generate filename from URL/title
-        domain = urlparse(args.url).netloc
-        title = result.get('title', 'unnamed_page')
-        
-        # Save the content
-        output_path = file_manager.save(markdown_content, domain, title)
-        
-        logger.info(f"Successfully saved markdown to {output_path}")
-        print(f"Content scraped and saved to: {output_path}")
-        
-    except Exception as e:
-        handle_exception(e)
-        sys.exit(1)
+from cli import main_cli
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main_cli()
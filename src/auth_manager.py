@@ -6,28 +6,99 @@ with special focus on Confluence authentication.
 """
 
 import logging
-import base64
+import binascii
 import json
 import os
+import tempfile
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import keyring
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from error_handler import AuthenticationError
+from url_patterns import split_url
 
 logger = logging.getLogger(__name__)
 
+# Location of the fallback credentials store
+_CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".web_scraper")
+_CONFIG_FILE = os.path.join(_CONFIG_DIR, "credentials.json")
+
+@lru_cache(maxsize=256)
+def _confluence_base(url: str) -> str:
+    """
+    Get the base URL (scheme and host) of a Confluence URL.
+    
+    Args:
+        url: Confluence URL
+        
+    Returns:
+        str: Base URL, e.g. https://domain.com
+    """
+    parts = split_url(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+def _json_loads(data: bytes) -> Dict:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Dict) -> bytes:
+    """Encode an object as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Parsed credentials config, reused while the file's mtime is unchanged
+_config_cache = {'mtime': None, 'data': None}
+
+def _load_credentials_config() -> Dict:
+    """
+    Load the credentials config file, reusing the last parse if unchanged.
+    
+    Returns:
+        Dict: Parsed credentials config
+    """
+    mtime = os.stat(_CONFIG_FILE).st_mtime_ns
+    if _config_cache['data'] is None or mtime != _config_cache['mtime']:
+        with open(_CONFIG_FILE, 'rb') as f:
+            _config_cache['data'] = _json_loads(f.read())
+        _config_cache['mtime'] = mtime
+    return _config_cache['data']
+
 class AuthManager:
     """
     Manages authentication for web scraping.
     """
     
+    # Set once the credentials config directory is known to exist
+    _config_dir_ready = False
+    
     def __init__(self):
         """
         Initialize the authentication manager.
         """
         logger.debug("Initializing AuthManager")
         
+        # Reuse one pooled session so repeated validations keep the connection alive
+        self._session = requests.Session()
+        self._session.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._session.mount("https://", adapter)
+        
     def get_auth_for_url(self, url: str, username: Optional[str] = None, 
                          password: Optional[str] = None) -> Dict:
         """
@@ -41,7 +112,7 @@ class AuthManager:
         Returns:
             Dict: Authentication configuration
         """
-        logger.info(f"Getting authentication for {url}")
+        logger.info("Getting authentication for %s", url)
         
         # If username and password provided directly, use them
         if username and password:
@@ -53,7 +124,7 @@ class AuthManager:
             return self._create_auth_config(stored_username, stored_password)
         
         # No authentication available
-        logger.warning(f"No authentication credentials found for {url}")
+        logger.warning("No authentication credentials found for %s", url)
         return {}
     
     def setup_confluence_auth(self, url: str, username: str, password: str, 
@@ -70,7 +141,7 @@ class AuthManager:
         Returns:
             Dict: Confluence authentication configuration
         """
-        logger.info(f"Setting up Confluence authentication for {url}")
+        logger.info("Setting up Confluence authentication for %s", url)
         
         try:
             # Validate Confluence credentials
@@ -91,7 +162,7 @@ class AuthManager:
             return auth_config
             
         except Exception as e:
-            logger.error(f"Failed to set up Confluence authentication: {str(e)}")
+            logger.error("Failed to set up Confluence authentication: %s", e)
             raise AuthenticationError(f"Failed to set up Confluence authentication: {str(e)}")
     
     def _create_auth_config(self, username: str, password: str) -> Dict:
@@ -125,16 +196,12 @@ class AuthManager:
             bool: True if credentials are valid
         """
         try:
-            # Get base URL (without path)
-            parts = url.split('/')
-            base_url = '/'.join(parts[:3])  # http(s)://domain.com
-            
             # Try to access Confluence REST API
-            rest_url = f"{base_url}/rest/api/space"
+            rest_url = f"{_confluence_base(url)}/rest/api/space"
             
-            response = requests.get(
+            response = self._session.get(
                 rest_url,
-                auth=(username, password),
+                auth=HTTPBasicAuth(username, password),
                 timeout=10
             )
             
@@ -142,11 +209,11 @@ class AuthManager:
                 logger.info("Confluence credentials validated successfully")
                 return True
             else:
-                logger.warning(f"Confluence credential validation failed: {response.status_code}")
+                logger.warning("Confluence credential validation failed: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error validating Confluence credentials: {str(e)}")
+            logger.error("Error validating Confluence credentials: %s", e)
             return False
     
     def _store_credentials(self, url: str, username: str, password: str):
@@ -162,9 +229,9 @@ class AuthManager:
             # Use keyring to store the password securely
             service_name = f"web_scraper_{url}"
             keyring.set_password(service_name, username, password)
-            logger.info(f"Credentials stored securely for {url}")
+            logger.info("Credentials stored securely for %s", url)
         except Exception as e:
-            logger.warning(f"Failed to store credentials securely: {str(e)}")
+            logger.warning("Failed to store credentials securely: %s", e)
             # Fall back to config file if keyring fails
             self._store_credentials_in_config(url, username, password)
     
@@ -177,38 +244,49 @@ class AuthManager:
             username: Username
             password: Password
         """
-        config_dir = os.path.join(os.path.expanduser("~"), ".web_scraper")
-        os.makedirs(config_dir, exist_ok=True)
+        if not AuthManager._config_dir_ready:
+            os.makedirs(_CONFIG_DIR, exist_ok=True)
+            AuthManager._config_dir_ready = True
         
-        config_file = os.path.join(config_dir, "credentials.json")
+        config_file = _CONFIG_FILE
         
-        # Load existing config if it exists
+        # Load existing config if it exists (copied, the cached one is shared)
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                config = dict(_load_credentials_config())
             except:
                 config = {}
         else:
             config = {}
         
         # Add or update credentials
-        if 'sites' not in config:
-            config['sites'] = {}
+        config['sites'] = dict(config.get('sites', {}))
             
         # Encode password in base64 (minimal security)
-        encoded_password = base64.b64encode(password.encode()).decode()
+        encoded_password = binascii.b2a_base64(password.encode('utf-8'), newline=False).decode('ascii')
         
         config['sites'][url] = {
             "username": username,
             "password": encoded_password
         }
         
-        # Save config
-        with open(config_file, 'w') as f:
-            json.dump(config, f)
+        # Save config atomically so concurrent readers never see a partial
+        # file; each writer gets its own temporary file in the same directory
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(config_file), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+        
+        _config_cache['data'] = config
+        _config_cache['mtime'] = os.stat(config_file).st_mtime_ns
             
-        logger.info(f"Credentials stored in config file for {url}")
+        logger.info("Credentials stored in config file for %s", url)
     
     def _get_stored_credentials(self, url: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -236,7 +314,7 @@ class AuthManager:
             return username, password
             
         except Exception as e:
-            logger.warning(f"Failed to retrieve stored credentials: {str(e)}")
+            logger.warning("Failed to retrieve stored credentials: %s", e)
             return None, None
     
     def _get_credentials_from_config(self, url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -249,14 +327,13 @@ class AuthManager:
         Returns:
             Tuple: (username, password) if found, (None, None) otherwise
         """
-        config_file = os.path.join(os.path.expanduser("~"), ".web_scraper", "credentials.json")
+        config_file = _CONFIG_FILE
         
         if not os.path.exists(config_file):
             return None, None
             
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _load_credentials_config()
                 
             if 'sites' in config and url in config['sites']:
                 site_config = config['sites'][url]
@@ -265,10 +342,10 @@ class AuthManager:
                 
                 if username and encoded_password:
                     # Decode base64 password
-                    password = base64.b64decode(encoded_password.encode()).decode()
+                    password = binascii.a2b_base64(encoded_password).decode('utf-8')
                     return username, password
                     
         except Exception as e:
-            logger.warning(f"Failed to retrieve credentials from config: {str(e)}")
+            logger.warning("Failed to retrieve credentials from config: %s", e)
             
         return None, None
\ No newline at end of file
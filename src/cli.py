@@ -9,21 +9,27 @@ import os
 import sys
 import asyncio
 import logging
-from urllib.parse import urlparse
+import time
+from functools import lru_cache
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from crawler import Crawler
-from confluence_scraper import RobustCrawler
-from processor import ContentProcessor
-from file_manager import FileManager
 from error_handler import setup_logging, handle_exception
+from url_patterns import is_confluence, split_url, url_netloc
 
 
-def parse_arguments():
+@lru_cache(maxsize=None)
+def _build_parser():
     """
-    Parse command line arguments.
+    Build the command line argument parser.
+
+    The parser is built once per process and reused by later calls.
 
     Returns:
-        argparse.Namespace: The parsed command line arguments.
+        argparse.ArgumentParser: The configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Web Scraper with crawl4ai - Convert web pages to markdown",
@@ -33,8 +39,11 @@ def parse_arguments():
     # Required arguments
     parser.add_argument(
         "--url",
+        dest="urls",
+        metavar="URL",
+        nargs="+",
         required=True,
-        help="URL of the webpage to scrape"
+        help="URL(s) of the webpage(s) to scrape"
     )
 
     # Optional arguments
@@ -116,6 +125,20 @@ def parse_arguments():
         help="Enable JavaScript rendering for dynamic content"
     )
 
+    advanced_group.add_argument(
+        "--concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of URLs to scrape at the same time"
+    )
+
+    advanced_group.add_argument(
+        "--host-delay",
+        type=float,
+        default=0.0,
+        help="Minimum delay in seconds between requests to the same host"
+    )
+
     advanced_group.add_argument(
         "--wait-time",
         type=int,
@@ -123,23 +146,77 @@ def parse_arguments():
         help="Wait time in seconds for page rendering"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: The parsed command line arguments.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
 
-    # Validate URL
-    parsed_url = urlparse(args.url)
-    if not all([parsed_url.scheme, parsed_url.netloc]):
-        parser.error("Invalid URL format. Please provide a complete URL including scheme (e.g., https://)")
+    # Validate URLs
+    for url in args.urls:
+        parsed_url = split_url(url)
+        if not (parsed_url.scheme and parsed_url.netloc):
+            parser.error("Invalid URL format. Please provide a complete URL including scheme (e.g., https://)")
 
+    # Keep the first URL as args.url for components that expect a single URL
+    args.url = args.urls[0]
     args.output = os.path.abspath(args.output)
 
     # Auto-detect Confluence URLs
-    if not args.confluence and ('confluence' in args.url.lower() or 'atlassian.net' in args.url.lower()):
+    if not args.confluence and is_confluence(args.url):
         args.confluence = True
         logging.info(f"Auto-detected Confluence URL: {args.url}")
 
     return args
 
 
+async def scrape_url(url, crawler, processor, file_manager):
+    """
+    Crawl a single URL, convert it to markdown and save it.
+
+    Returns:
+        str: Path to the saved markdown file.
+    """
+    result = await crawler.crawl(url)
+    markdown_content = processor.process(result)
+
+    domain = url_netloc(url)
+    title = result.get('title', 'unnamed_page')
+
+    return await file_manager.save_async(markdown_content, domain, title)
+
+
+async def scrape_urls(urls, crawler, processor, file_manager, concurrency=5):
+    """
+    Scrape several URLs concurrently, with at most `concurrency` in flight.
+
+    Returns:
+        list: Output path or exception for each URL, in input order.
+    """
+    logger = logging.getLogger(__name__)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def scrape_one(url):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                return await scrape_url(url, crawler, processor, file_manager)
+            finally:
+                logger.info(f"Finished {url} in {time.perf_counter() - start:.2f}s")
+
+    return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+
+
 async def async_main():
     """Main async function for the web scraper application."""
     setup_logging()
@@ -147,29 +224,41 @@ async def async_main():
 
     try:
         args = parse_arguments()
-        logger.info(f"Starting scrape of {args.url}")
+        logger.info(f"Starting scrape of {', '.join(args.urls)}")
+
+        # Import the heavy crawling modules only once arguments are valid,
+        # so --help and usage errors never load crawl4ai/Playwright
+        from processor import ContentProcessor
+        from file_manager import FileManager
 
         # Decide crawler based on URL
         if args.confluence:
+            from confluence_scraper import RobustCrawler
             crawler = RobustCrawler(args)
         else:
+            from crawler import Crawler
             crawler = Crawler(args)
 
         processor = ContentProcessor()
         file_manager = FileManager(args.output)
 
-        result = await crawler.crawl(args.url)
-        markdown_content = processor.process(result)
-
-        domain = urlparse(args.url).netloc
-        title = result.get('title', 'unnamed_page')
+        try:
+            results = await scrape_urls(args.urls, crawler, processor, file_manager, args.concurrency)
+        finally:
+            await crawler.aclose()
 
-        output_path = file_manager.save(markdown_content, domain, title)
+        exit_code = 0
+        for url, output_path in zip(args.urls, results):
+            if isinstance(output_path, BaseException):
+                logger.error(f"Failed to scrape {url}")
+                handle_exception(output_path)
+                exit_code = 1
+                continue
 
-        logger.info(f"Successfully saved markdown to {output_path}")
-        print(f"Content scraped and saved to: {output_path}")
+            logger.info(f"Successfully saved markdown to {output_path}")
+            print(f"Content scraped and saved to: {output_path}")
 
-        return 0
+        return exit_code
 
     except Exception as e:
         handle_exception(e)
@@ -182,7 +271,9 @@ def main_cli():
     This function is called when the user runs the 'scrapemd' command.
     """
     try:
-        exit_code = asyncio.run(async_main())
+        # Run on uvloop's faster event loop when it is installed
+        run = uvloop.run if uvloop is not None else asyncio.run
+        exit_code = run(async_main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
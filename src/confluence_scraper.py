@@ -3,30 +3,138 @@ Robust Crawler for Confluence and General Websites
 """
 
 import os
+import re
 import logging
 import asyncio
+from contextlib import AsyncExitStack
+from functools import lru_cache
 from typing import Dict, Any
-import urllib.parse
-from crawl4ai import AsyncWebCrawler
-from bs4 import BeautifulSoup
-from atlassian import Confluence
 
 logger = logging.getLogger(__name__)
 
+# Supported page ID locations: ?pageId=123456, /pages/123456, /l/cp/abcDEF123
+PAGE_ID_RE = re.compile(
+    r'[?&]pageId=(?P<query>[^&#]+)'
+    r'|/pages/(?P<path>\d+)(?=[/?#]|$)'
+    r'|/l/cp/(?P<short>[^/?#]+)'
+)
+
+@lru_cache(maxsize=4096)
+def _find_page_id(url):
+    match = PAGE_ID_RE.search(url)
+    if match is None:
+        return None
+    return match.group('query') or match.group('path') or match.group('short')
+
+@lru_cache(maxsize=8)
+def _get_confluence_client(url, username, token):
+    """Return a Confluence client per (url, user), reusing its HTTP session."""
+    from atlassian import Confluence
+    return Confluence(url=url, username=username, password=token)
+
+# Elements stripped before text extraction
+_UNWANTED_TAGS = frozenset(("script", "style", "nav", "header", "footer"))
+
+# Size of the chunks fed to the streaming HTML parser
+_FEED_CHUNK_SIZE = 64 * 1024
+
+class _MainContentCollector:
+    """
+    lxml parser target that collects page text while the HTML streams past.
+
+    No tree is built: text is kept for the whole page, the first <article>
+    and <div id="main-content">, skipping unwanted elements. Whole-page
+    text is only kept until one of those containers opens. Once the
+    main-content div closes, nothing later in the page can change the
+    result, so `done` tells the caller to stop feeding input.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.skip_depth = 0
+        self.buffer = []
+        self.page = []
+        self.main = None
+        self.main_depth = None
+        self.article = None
+        self.article_depth = None
+        self.done = False
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        text = ''.join(self.buffer).strip()
+        self.buffer = []
+        if not text:
+            return
+        if self.page is not None:
+            self.page.append(text)
+        if self.main_depth is not None:
+            self.main.append(text)
+        if self.article_depth is not None:
+            self.article.append(text)
+
+    def start(self, tag, attrib):
+        self._flush()
+        self.depth += 1
+        if self.skip_depth:
+            return
+        if tag in _UNWANTED_TAGS:
+            self.skip_depth = self.depth
+        elif tag == 'div' and self.main is None and attrib.get('id') == 'main-content':
+            self.main = []
+            self.main_depth = self.depth
+            # A container was found, so the whole-page fallback is never used
+            self.page = None
+        elif tag == 'article' and self.article is None:
+            self.article = []
+            self.article_depth = self.depth
+            self.page = None
+
+    def end(self, tag):
+        self._flush()
+        if self.skip_depth == self.depth:
+            self.skip_depth = 0
+        if self.main_depth == self.depth:
+            self.main_depth = None
+            self.done = True
+        if self.article_depth == self.depth:
+            self.article_depth = None
+        self.depth -= 1
+
+    def data(self, data):
+        if not self.skip_depth:
+            self.buffer.append(data)
+
+    def close(self):
+        self._flush()
+        for pieces in (self.main, self.article, self.page):
+            if pieces is not None:
+                return "\n".join(pieces)
+        return ""
+
 class RobustCrawler:
     def __init__(self, args):
         self.args = args
+        options = vars(args)
         # Store URL from args if available, but it can be overridden in crawl method
-        self.url = getattr(args, 'url', None)
-        self.space_key = getattr(args, 'space', None)
-        self.page_id = getattr(args, 'page_id', None)
-        self.timeout = getattr(args, 'timeout', 60)
-        self.render_js = getattr(args, 'render_js', True)
-        self.wait_time = getattr(args, 'wait_time', 10)
+        self.url = options.get('url')
+        self.space_key = options.get('space')
+        self.page_id = options.get('page_id')
+        self.timeout = options.get('timeout', 60)
+        self.render_js = options.get('render_js', True)
+        self.wait_time = options.get('wait_time', 10)
 
         self.confluence_api_token = os.environ.get('CONFLUENCE_API_TOKEN')
         self.confluence_username = os.environ.get('CONFLUENCE_EMAIL')
         self.confluence = None
+        # Set once client setup has run for a URL, whatever the outcome
+        self._client_setup_done = False
+
+        # HTML fallback browser is started on first use and reused
+        self._crawler = None
+        self._crawler_stack = None
+        self._crawler_lock = asyncio.Lock()
 
         # Only setup Confluence client if URL is available
         if self.url:
@@ -40,23 +148,23 @@ class RobustCrawler:
             logger.warning("No URL provided for Confluence client setup.")
             return
             
+        self._client_setup_done = True
         if self.confluence_api_token and self.confluence_username:
-            self.confluence = Confluence(
-                url=confluence_url,
-                username=self.confluence_username,
-                password=self.confluence_api_token
+            self.confluence = _get_confluence_client(
+                confluence_url,
+                self.confluence_username,
+                self.confluence_api_token
             )
             logger.info("Confluence API client configured.")
         else:
             logger.warning("Confluence API credentials missing. Falling back to HTML crawling.")
 
     async def crawl(self, url: str) -> Dict[str, Any]:
-        # Update the URL and set up Confluence client if needed
+        # Update the URL; the client is set up at most once per crawler
         if url != self.url:
             self.url = url
-            # If we don't have a Confluence client yet, try to set it up with the new URL
-            if not self.confluence:
-                self._setup_confluence_client(url)
+        if not self._client_setup_done:
+            self._setup_confluence_client(url)
         
         if self.confluence:
             try:
@@ -73,25 +181,48 @@ class RobustCrawler:
 
         # HTML fallback
         logger.info(f"Using HTML fallback for {url}")
-        async with AsyncWebCrawler() as crawler:
-            crawler.timeout = self.timeout
-            crawler.javascript = self.render_js
-            crawler.wait_for = self.wait_time
-
-            result = await crawler.arun(url=url)
-            content = self._extract_with_beautifulsoup(result.html)
-            return {'content': content, 'source': 'html_fallback', 'url': url}
-
-    def _extract_with_beautifulsoup(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        for unwanted in soup(["script", "style", "nav", "header", "footer"]):
-            unwanted.decompose()
-        main_content = soup.find("div", {"id": "main-content"}) or soup.find("article") or soup
-        return main_content.get_text(separator="\n", strip=True)
+        crawler = await self._get_browser()
+        result = await crawler.arun(url=url)
+        content = self._extract_main_content(result.html)
+        return {'content': content, 'source': 'html_fallback', 'url': url}
+
+    async def _get_browser(self):
+        async with self._crawler_lock:
+            if self._crawler is None:
+                from crawl4ai import AsyncWebCrawler
+                # Keep what the context manager hands back; the stack exits it on close
+                stack = AsyncExitStack()
+                crawler = await stack.enter_async_context(AsyncWebCrawler())
+                crawler.timeout = self.timeout
+                crawler.javascript = self.render_js
+                crawler.wait_for = self.wait_time
+                self._crawler = crawler
+                self._crawler_stack = stack
+        return self._crawler
+
+    async def aclose(self):
+        if self._crawler_stack is not None:
+            stack, self._crawler_stack = self._crawler_stack, None
+            self._crawler = None
+            await stack.aclose()
+
+    def _extract_main_content(self, html):
+        if not html:
+            return ""
+        from lxml import etree
+        collector = _MainContentCollector()
+        parser = etree.HTMLParser(target=collector)
+        for start in range(0, len(html), _FEED_CHUNK_SIZE):
+            parser.feed(html[start:start + _FEED_CHUNK_SIZE])
+            if collector.done:
+                break
+        return parser.close()
 
     def _html_to_markdown(self, html):
         import html2text
-        return html2text.html2text(html)
+        converter = html2text.HTML2Text()
+        converter.body_width = 0  # No wrapping, same as ContentProcessor
+        return converter.handle(html)
 
     def _extract_page_id(self, url):
         """
@@ -103,40 +234,11 @@ class RobustCrawler:
         """
         logger.debug(f"Extracting page ID from URL: {url}")
         
-        # Try to extract from query parameters first
-        parsed_url = urllib.parse.urlparse(url)
-        query_params = urllib.parse.parse_qs(parsed_url.query)
-        page_id = query_params.get('pageId', [None])[0]
-        
+        page_id = _find_page_id(url)
         if page_id:
-            logger.debug(f"Found page ID in query parameter: {page_id}")
+            logger.debug(f"Found page ID: {page_id}")
             return page_id
             
-        # Try to extract from path
-        path_parts = parsed_url.path.split('/')
-        
-        # Format: /wiki/spaces/SPACE/pages/123456
-        if 'pages' in path_parts:
-            pages_index = path_parts.index('pages')
-            if pages_index < len(path_parts) - 1:
-                page_id = path_parts[pages_index + 1]
-                if page_id.isdigit():
-                    logger.debug(f"Found page ID in path: {page_id}")
-                    return page_id
-        
-        # Format: /display/SPACE/Page+Title?pageId=123456
-        if 'display' in path_parts:
-            # Already checked query params above
-            pass
-            
-        # Format: /l/cp/abcDEF123 (short link format)
-        if 'l' in path_parts and 'cp' in path_parts:
-            cp_index = path_parts.index('cp')
-            if cp_index < len(path_parts) - 1:
-                page_id = path_parts[cp_index + 1]
-                logger.debug(f"Found page ID in short link format: {page_id}")
-                return page_id
-                
         logger.warning(f"Could not extract page ID from URL: {url}")
         return None
 
@@ -156,10 +258,21 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    crawler = RobustCrawler(args)
+    async def run():
+        crawler = RobustCrawler(args)
+        try:
+            return await crawler.crawl(args.url)
+        finally:
+            await crawler.aclose()
+
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
 
-    loop = asyncio.get_event_loop()
-    result = loop.run_until_complete(crawler.crawl(args.url))
+    # Run on uvloop's faster event loop when it is installed
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    result = runner(run())
 
     print(f"Crawl result from {result['source']}:")
     print(result['content'])
@@ -1,22 +1,147 @@
 import logging
 import asyncio
 import re
-from typing import Dict, Any
-from confluence_scraper import RobustCrawler
+from contextlib import AsyncExitStack
+from html import unescape
+from typing import Dict, Any, List, Optional
+import lxml.html
+from url_patterns import is_confluence, url_netloc
 from crawl4ai import AsyncWebCrawler
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
 logger = logging.getLogger(__name__)
 
+_UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# The start of the page is scanned for a plain-text <title> or <h1> before parsing
+_TITLE_SCAN_LIMIT = 64 * 1024
+# Comments and script/style content are skipped while looking for those tags
+_TITLE_TOKEN_RE = re.compile(r'<!--|<(script|style|title|h1)\b', re.I)
+_RAW_TEXT_END_RES = {
+    tag: re.compile(rf'</{tag}\s*>', re.I)
+    for tag in ('script', 'style')
+}
+_PLAIN_TITLE_RES = {
+    tag: re.compile(rf'<{tag}(?:\s[^>]*)?>([^<]{{1,512}})</{tag}\s*>', re.I)
+    for tag in ('title', 'h1')
+}
+
+def _find_start_tag(head: str, tag: str) -> Optional[int]:
+    """
+    Find the first start tag of an element, skipping comments and script/style content.
+    
+    Args:
+        head: Start of the HTML page
+        tag: Lowercase tag name, 'title' or 'h1'
+        
+    Returns:
+        int: Position of the start tag, or -1 if a comment or script/style
+        element is left open within `head`; None if there is no such tag
+    """
+    pos = 0
+    while True:
+        match = _TITLE_TOKEN_RE.search(head, pos)
+        if match is None:
+            return None
+        name = match.group(1)
+        if name is None:
+            # Comment: resume after it
+            end = head.find('-->', match.end())
+            if end < 0:
+                return -1
+            pos = end + 3
+            continue
+        name = name.lower()
+        if name == tag:
+            return match.start()
+        end_re = _RAW_TEXT_END_RES.get(name)
+        if end_re is None:
+            pos = match.end()
+            continue
+        end = end_re.search(head, match.end())
+        if end is None:
+            return -1
+        pos = end.end()
+
+# First level-1 heading of a markdown document, searched near its start
+_MD_TITLE_SCAN_LIMIT = 4096
+_MD_TITLE_RE = re.compile(r'^[ \t]*#[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$', re.M)
+
 class Crawler:
-    def __init__(self, args):
+    def __init__(self, args, keep_raw: bool = False):
         self.args = args
-        self.confluence_patterns = [
-            re.compile(r'confluence', re.I),
-            re.compile(r'atlassian\.net', re.I)
-        ]
+        # Raw page HTML is only kept in results when asked for
+        self.keep_raw = keep_raw
+        # Browser and Confluence delegate are started on first use and reused
+        self._crawler = None
+        self._crawler_stack = None
+        self._crawler_lock = asyncio.Lock()
+        self._robust_crawler = None
+        # Minimum delay between request starts against the same host
+        self.host_delay = vars(args).get('host_delay', 0.0)
+        self._host_locks = {}
+        self._host_next_time = {}
+
+    async def _get_browser(self) -> AsyncWebCrawler:
+        """
+        Get the shared crawl4ai browser, starting it on first use.
+        
+        Returns:
+            AsyncWebCrawler: The running crawler
+        """
+        async with self._crawler_lock:
+            if self._crawler is None:
+                options = vars(self.args)
+                # Keep what the context manager hands back; the stack exits it on close
+                stack = AsyncExitStack()
+                crawler = await stack.enter_async_context(AsyncWebCrawler())
+                crawler.timeout = options.get('timeout', 30)
+                crawler.javascript = options.get('render_js', True)
+                crawler.wait_for = options.get('wait_time', 5)
+                self._crawler = crawler
+                self._crawler_stack = stack
+        return self._crawler
+
+    async def aclose(self):
+        """
+        Shut down the shared browser and Confluence delegate, if started.
+        """
+        if self._crawler_stack is not None:
+            stack, self._crawler_stack = self._crawler_stack, None
+            self._crawler = None
+            await stack.aclose()
+        if self._robust_crawler is not None:
+            robust_crawler, self._robust_crawler = self._robust_crawler, None
+            await robust_crawler.aclose()
+
+    async def _wait_for_host(self, url: str):
+        """
+        Wait until the host of a URL may be requested again.
+        
+        Requests to different hosts never wait on each other; requests to
+        the same host start at least `host_delay` seconds apart.
+        
+        Args:
+            url: The URL about to be crawled
+        """
+        if not self.host_delay:
+            return
+        
+        host = url_netloc(url)
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            delay = self._host_next_time.get(host, 0.0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_next_time[host] = loop.time() + self.host_delay
 
     def is_confluence_url(self, url: str) -> bool:
-        return any(pattern.search(url) for pattern in self.confluence_patterns)
+        return is_confluence(url)
         
     def _extract_title_from_html(self, html: str) -> str:
         """
@@ -28,70 +153,178 @@ class Crawler:
         Returns:
             str: Extracted title or empty string if not found
         """
-        if not html:
+        if not html or html.isspace():
             return ""
+        
+        # Plain-text title near the top of the page: no parse needed
+        title = self._extract_plain_title(html)
+        if title:
+            return title
             
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            if SelectolaxParser is not None:
+                return self._extract_title_with_selectolax(html)
+            
+            try:
+                root = lxml.html.fromstring(html)
+            except ValueError:
+                # lxml rejects str input that carries an XML encoding declaration
+                root = lxml.html.fromstring(html.encode('utf-8'), parser=_UTF8_PARSER)
             
             # Check <title> tag
-            if soup.title and soup.title.string:
-                return soup.title.string.strip()
+            title = root.findtext('.//title')
+            if title and title.strip():
+                return title.strip()
             
             # Check main heading
-            h1 = soup.find('h1')
-            if h1 and h1.text:
-                return h1.text.strip()
+            h1 = root.find('.//h1')
+            if h1 is not None:
+                text = h1.text_content().strip()
+                if text:
+                    return text
                 
             # Check for other headings
-            for heading in soup.find_all(['h2', 'h3'], limit=1):
-                if heading.text:
-                    return heading.text.strip()
+            for heading in root.xpath('(//h2 | //h3)[1]'):
+                text = heading.text_content().strip()
+                if text:
+                    return text
         except Exception as e:
             logger.error(f"Error extracting title from HTML: {str(e)}")
             
         return ""
 
+    def _extract_plain_title(self, html: str) -> str:
+        """
+        Extract the title from HTML content without parsing it.
+        
+        Only answers when the result is certain to match the parser's: the
+        first <title> (or, with no <title> in the page, the first <h1>)
+        holds plain text. Anything else is left to the parser.
+        
+        Args:
+            html: HTML content string
+            
+        Returns:
+            str: Extracted title or empty string if the page must be parsed
+        """
+        head = html[:_TITLE_SCAN_LIMIT]
+        tag = 'title'
+        start = _find_start_tag(head, tag)
+        if start is None and len(html) <= _TITLE_SCAN_LIMIT:
+            # No <title> anywhere in the page: the main heading is next
+            tag = 'h1'
+            start = _find_start_tag(head, tag)
+        if start is None or start < 0:
+            return ""
+        
+        match = _PLAIN_TITLE_RES[tag].match(head, start)
+        return unescape(match.group(1)).strip() if match else ""
+
+    def _extract_title_with_selectolax(self, html: str) -> str:
+        """
+        Extract the title from HTML content with selectolax's lexbor parser.
+        
+        Args:
+            html: HTML content string
+            
+        Returns:
+            str: Extracted title or empty string if not found
+        """
+        tree = SelectolaxParser(html)
+        
+        # Check <title>, then the main heading, then the first h2/h3
+        for selector in ('title', 'h1', 'h2, h3'):
+            node = tree.css_first(selector)
+            if node is not None:
+                text = node.text().strip()
+                if text:
+                    return text
+        
+        return ""
+
+    def _extract_title_from_markdown(self, markdown: str) -> str:
+        """
+        Extract the title from the first level-1 heading of markdown content.
+        
+        Args:
+            markdown: Markdown content string
+            
+        Returns:
+            str: Extracted title or empty string if not found
+        """
+        match = _MD_TITLE_RE.search(markdown, 0, _MD_TITLE_SCAN_LIMIT)
+        return match.group(1) if match else ""
+
     async def crawl(self, url: str) -> Dict[str, Any]:
+        await self._wait_for_host(url)
+        
         if self.is_confluence_url(url):
             logger.info(f"Detected Confluence URL: {url}. Delegating to RobustCrawler.")
-            robust_crawler = RobustCrawler(self.args)
-            result = await robust_crawler.crawl(url)
+            if self._robust_crawler is None:
+                from confluence_scraper import RobustCrawler
+                self._robust_crawler = RobustCrawler(self.args)
+            result = await self._robust_crawler.crawl(url)
             result['handled_by'] = 'confluence_scraper'
             return result
 
         # Non-Confluence fallback
-        logger.info(f"Handling URL with crawl4ai: {url}")
-        async with AsyncWebCrawler() as crawler:
-            crawler.timeout = getattr(self.args, 'timeout', 30)
-            crawler.javascript = getattr(self.args, 'render_js', True)
-            crawler.wait_for = getattr(self.args, 'wait_time', 5)
+        logger.debug(f"Handling URL with crawl4ai: {url}")
+        crawler = await self._get_browser()
+        result = await crawler.arun(url=url)
+        
+        # Use the available attributes from CrawlResult
+        # First try to use markdown, then html, then cleaned_html
+        markdown = str(result.markdown) if getattr(result, 'markdown', None) else ""
+        html = getattr(result, 'html', None) or ""
+        cleaned_html = getattr(result, 'cleaned_html', None)
+        
+        content = ""
+        if markdown:
+            content = markdown
+            logger.debug("Using markdown content from crawl4ai")
+        elif html:
+            content = html
+            logger.debug("Using HTML content from crawl4ai")
+        elif cleaned_html:
+            content = cleaned_html
+            logger.debug("Using cleaned HTML content from crawl4ai")
+        
+        # The markdown heading gives the title without parsing the HTML
+        title = self._extract_title_from_markdown(markdown) if markdown else ""
+        if not title and html:
+            title = self._extract_title_from_html(html)
+        
+        # Create a result dictionary; the markdown is either the content
+        # itself or empty, while the raw HTML would keep the whole page alive
+        crawl_result = {
+            'content': content,
+            'handled_by': 'crawl4ai',
+            'url': url,
+            'title': title,
+            'markdown': markdown
+        }
+        if self.keep_raw:
+            crawl_result['html'] = html
+        return crawl_result
 
-            result = await crawler.arun(url=url)
-            
-            # Use the available attributes from CrawlResult
-            # First try to use markdown, then html, then cleaned_html
-            content = ""
-            if hasattr(result, 'markdown') and result.markdown:
-                content = str(result.markdown)
-                logger.info("Using markdown content from crawl4ai")
-            elif hasattr(result, 'html') and result.html:
-                content = result.html
-                logger.info("Using HTML content from crawl4ai")
-            elif hasattr(result, 'cleaned_html') and result.cleaned_html:
-                content = result.cleaned_html
-                logger.info("Using cleaned HTML content from crawl4ai")
+    async def crawl_many(self, urls: List[str], concurrency: int = 5) -> List[Any]:
+        """
+        Crawl several URLs concurrently on the shared browser.
+        
+        Args:
+            urls: URLs to crawl
+            concurrency: Maximum number of URLs crawled at the same time
             
-            # Create a result dictionary with all available information
-            return {
-                'content': content,
-                'handled_by': 'crawl4ai',
-                'url': url,
-                'title': self._extract_title_from_html(result.html) if hasattr(result, 'html') and result.html else "",
-                'html': result.html if hasattr(result, 'html') else "",
-                'markdown': str(result.markdown) if hasattr(result, 'markdown') and result.markdown else ""
-            }
+        Returns:
+            list: Result dictionary or exception for each URL, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def crawl_one(url):
+            async with semaphore:
+                return await self.crawl(url)
+        
+        return await asyncio.gather(*(crawl_one(url) for url in urls), return_exceptions=True)
 
 # Usage example:
 if __name__ == "__main__":
@@ -108,9 +341,21 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    crawler = Crawler(args)
-    loop = asyncio.get_event_loop()
-    result = loop.run_until_complete(crawler.crawl(args.url))
+    async def run():
+        crawler = Crawler(args)
+        try:
+            return await crawler.crawl(args.url)
+        finally:
+            await crawler.aclose()
+
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    # Run on uvloop's faster event loop when it is installed
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    result = runner(run())
 
     print(f"Handled by {result['handled_by']}:")
     print(result['content'])
@@ -4,13 +4,19 @@ Error Handler module for the Web Scraper
 This module handles errors and logging for the application.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import traceback
 from typing import Optional
 from datetime import datetime
 
+# Background listener that writes queued log records to the real handlers
+_log_listener = None
+
 def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None):
     """
     Set up logging for the application.
@@ -36,15 +42,23 @@ def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None):
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         log_file = os.path.join(logs_dir, f"scraper_{timestamp}.log")
     
-    # Configure logging
-    logging.basicConfig(
-        level=numeric_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Configure logging (once, like logging.basicConfig); records are queued
+    # and written by a background listener, so concurrent crawls never wait
+    # on file or console output
+    global _log_listener
+    root = logging.getLogger()
+    if not root.handlers:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(numeric_level)
     
     # Set third-party loggers to a higher level to reduce noise
     for logger_name in ['urllib3', 'asyncio', 'playwright']:
@@ -53,6 +67,14 @@ def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None):
     logging.info(f"Logging initialized at level {log_level}")
     logging.info(f"Log file: {log_file}")
 
+@atexit.register
+def _stop_log_listener():
+    """Flush queued log records before the interpreter exits."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 def handle_exception(exception: Exception, exit_app: bool = False):
     """
     Handle exceptions in a consistent way.
@@ -6,14 +6,44 @@ and saving markdown files.
 """
 
 import os
-import re
+import asyncio
+import itertools
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Spaces become underscores; characters invalid in filenames are dropped
+_SANITIZE_TABLE = str.maketrans({' ': '_', **dict.fromkeys('\\/*?:"<>|')})
+
+# Large documents are written in slices of this many characters
+_WRITE_CHUNK_SIZE = 1 << 20
+
+@lru_cache(maxsize=1024)
+def _sanitize(name: str) -> str:
+    """
+    Sanitize a string for use as a filename, reusing results for repeated names.
+    
+    Args:
+        name: The string to sanitize
+        
+    Returns:
+        str: A sanitized string valid for use as a filename
+    """
+    # Replace spaces with underscores and remove invalid filename characters
+    sanitized = name.translate(_SANITIZE_TABLE)
+    
+    # Limit length and remove trailing periods
+    sanitized = sanitized[:100].rstrip('.')
+    
+    # Ensure we have at least some valid characters
+    if not sanitized or sanitized.isspace():
+        sanitized = "unnamed"
+    
+    return sanitized
+
 class FileManager:
     """
     Manages file operations for the web scraper application.
@@ -37,6 +67,14 @@ class FileManager:
             # Default to the 'scraped_content' directory in the project root
             self.base_output_dir = os.path.join(project_root, "scraped_content")
         
+        # Output directory prefixes (ending in a separator) already created,
+        # keyed by (domain, space_key)
+        self._output_prefixes = {}
+        
+        # One timestamp per run plus a counter keeps filenames unique
+        self._run_stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self._counter = itertools.count()
+        
         logger.debug(f"Initializing FileManager with base directory: {self.base_output_dir}")
     
     def save(self, content: str, domain: str, title: str, space_key: Optional[str] = None) -> str:
@@ -53,24 +91,65 @@ class FileManager:
             str: Path to the saved file
         """
         # Create the output directory structure
-        output_dir = self._create_output_dir(domain, space_key)
+        output_prefix = self._output_prefix(domain, space_key)
         
         # Generate a valid filename from the title
         filename = self._generate_filename(title)
         
         # Full path to the output file
-        output_path = os.path.join(output_dir, filename)
+        output_path = output_prefix + filename
         
         # Save the content to the file
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            logger.info(f"Content saved to {output_path}")
+            # Write pre-encoded UTF-8 slices in binary mode: no text layer, a
+            # single write for most pages, and a large document is never
+            # encoded in one piece
+            with open(output_path, 'wb', buffering=_WRITE_CHUNK_SIZE) as f:
+                for start in range(0, len(content), _WRITE_CHUNK_SIZE):
+                    f.write(content[start:start + _WRITE_CHUNK_SIZE].encode('utf-8'))
+            logger.debug(f"Content saved to {output_path}")
             return output_path
         except Exception as e:
             logger.error(f"Failed to save content to {output_path}: {str(e)}")
             raise IOError(f"Failed to save content: {str(e)}")
     
+    async def save_async(self, content: str, domain: str, title: str,
+                         space_key: Optional[str] = None) -> str:
+        """
+        Save content to a file without blocking the event loop.
+        
+        Args:
+            content: The markdown content to save
+            domain: The domain of the scraped site
+            title: The title of the page
+            space_key: The Confluence space key (optional)
+            
+        Returns:
+            str: Path to the saved file
+        """
+        return await asyncio.to_thread(self.save, content, domain, title, space_key)
+    
+    def _output_prefix(self, domain: str, space_key: Optional[str] = None) -> str:
+        """
+        Get the output directory for a domain/space as a path prefix.
+        
+        The directory is created and its prefix computed once per
+        (domain, space_key); later saves only concatenate the filename.
+        
+        Args:
+            domain: The domain of the scraped site
+            space_key: The Confluence space key (optional)
+            
+        Returns:
+            str: Path to the created directory, ending in a path separator
+        """
+        key = (domain, space_key)
+        prefix = self._output_prefixes.get(key)
+        if prefix is None:
+            prefix = os.path.join(self._create_output_dir(domain, space_key), '')
+            self._output_prefixes[key] = prefix
+        return prefix
+    
     def _create_output_dir(self, domain: str, space_key: Optional[str] = None) -> str:
         """
         Create the output directory structure.
@@ -114,11 +193,8 @@ class FileManager:
         # Sanitize the title for use as a filename
         filename = self._sanitize_filename(title)
         
-        # Add timestamp to ensure uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        
-        # Construct final filename with extension
-        return f"{filename}_{timestamp}.md"
+        # Add run timestamp and sequence number to ensure uniqueness
+        return f"{filename}_{self._run_stamp}_{next(self._counter):06d}.md"
     
     def _sanitize_filename(self, name: str) -> str:
         """
@@ -130,17 +206,4 @@ class FileManager:
         Returns:
             str: A sanitized string valid for use as a filename
         """
-        # Replace spaces with underscores
-        sanitized = name.replace(' ', '_')
-        
-        # Remove invalid filename characters
-        sanitized = re.sub(r'[\\/*?:"<>|]', '', sanitized)
-        
-        # Limit length and remove trailing periods
-        sanitized = sanitized[:100].rstrip('.')
-        
-        # Ensure we have at least some valid characters
-        if not sanitized or sanitized.isspace():
-            sanitized = "unnamed"
-        
-        return sanitized
\ No newline at end of file
+        return _sanitize(name)
\ No newline at end of file
@@ -4,13 +4,82 @@ Content Processor module for the Web Scraper
 This module handles the processing of crawled content and conversion to markdown.
 """
 
+import hashlib
 import logging
 import re
+from collections import OrderedDict
+from html import unescape
 from typing import Dict, Any, Optional
-from urllib.parse import urlparse
+
+try:
+    import html_to_markdown
+except ImportError:
+    html_to_markdown = None
+
+try:
+    import html2text
+except ImportError:
+    html2text = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Tree builder for BeautifulSoup: libxml2 when available, else the stdlib parser
+try:
+    from lxml import etree
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    _SOUP_PARSER = 'html.parser'
+
+from url_patterns import split_url
 
 logger = logging.getLogger(__name__)
 
+# Number of converted/post-processed documents remembered per processor
+_CACHE_SIZE = 128
+# Longest result (in characters) worth keeping, so the caches stay small
+_CACHE_MAX_LENGTH = 256 * 1024
+
+def _content_key(text: str) -> bytes:
+    """Short digest of a document, used as a cache key."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+# Size of the chunks fed to the streaming title parser
+_FEED_CHUNK_SIZE = 64 * 1024
+
+# Elements whose text is read as a title candidate
+_HEADING_TAGS = frozenset(('title', 'h1', 'h2', 'h3'))
+
+# Small fragments using only these tags are converted without a parser
+_SNIPPET_MAX_LENGTH = 2048
+_SNIPPET_TAGS = frozenset(('p', 'div', 'br', 'a', 'b', 'strong', 'i', 'em', 'span'))
+# Inline tags that must pair up, mapped to the markdown they produce
+_SNIPPET_PAIRED_TAGS = {'a': '[]', 'b': '**', 'strong': '**', 'i': '_', 'em': '_'}
+_SNIPPET_BLOCK_TAGS = frozenset(('p', 'div', 'br'))
+_SNIPPET_TAG_RE = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)\b([^>]*)>')
+_SNIPPET_HREF_RE = re.compile(r'(?:^|\s)href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.I)
+# Text the fast path would have to escape: markdown syntax characters
+# anywhere, list/heading/quote markers at the start of a line, and images
+_SNIPPET_MARKDOWN_CHARS_RE = re.compile(r'[\\`*_\[\]<]')
+_SNIPPET_BLOCK_MARKER_RE = re.compile(r'^[ \t]*(?:[-+#>]|\d+[.)])', re.M)
+_SNIPPET_LIST_MARKER_RE = re.compile(r'(?:[-+]|(?:^|\s)\d+\.)(?!\S)')
+_SNIPPET_BLANK_LINES_RE = re.compile(r'[ \t]*\n(?:[ \t]*\n)+')
+_SNIPPET_WHITESPACE_RE = re.compile(r'\s+')
+_SNIPPET_LINE_START_RE = re.compile(r'\n[ \t]+')
+
+# Characters allowed inside a table separator row (|---|:--:|)
+_TABLE_SEPARATOR_CHARS = frozenset('-:| ')
+
+# Level-1 heading markers; group 1 is set when followed by a space
+_H1_RE = re.compile(r'^#(?!#)( ?)', re.M)
+
+# Links directly followed by a word character (bracket/paren-free groups
+# keep the scan linear)
+_LINK_RE = re.compile(r'\[([^\]\n]*)\]\(([^)\n]*)\)(?=\w)')
+
 class ContentProcessor:
     """
     Process crawled content and convert to markdown format.
@@ -21,6 +90,39 @@ class ContentProcessor:
         Initialize the content processor.
         """
         logger.debug("Initializing ContentProcessor")
+        
+        # Conversion options for the native converter, built once; page
+        # metadata is left out, as the header already carries the title
+        self._md_options = (
+            html_to_markdown.ConversionOptions(extract_metadata=False)
+            if html_to_markdown is not None else None
+        )
+        
+        # Recent results keyed by input digest, so re-scraped pages skip the work
+        self._html_cache = OrderedDict()
+        self._markdown_cache = OrderedDict()
+    
+    def _remember(self, cache: OrderedDict, key: bytes, value: str) -> str:
+        """
+        Store a value in one of the LRU caches, evicting the oldest entry.
+        
+        Results longer than _CACHE_MAX_LENGTH are returned without being
+        stored.
+        
+        Args:
+            cache: The cache to store into
+            key: Digest of the input
+            value: The computed result
+            
+        Returns:
+            str: The stored value
+        """
+        if len(value) > _CACHE_MAX_LENGTH:
+            return value
+        cache[key] = value
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
     
     def process(self, result: Dict[str, Any]) -> str:
         """
@@ -37,22 +139,28 @@ class ContentProcessor:
         # Initialize the content variable
         markdown_content = None
         
+        # Look up each content source once
+        markdown = result.get('markdown')
+        content = result.get('content')
+        text = result.get('text')
+        html = result.get('html')
+        
         # Check content sources in priority order
-        if 'markdown' in result and result['markdown']:
+        if markdown:
             logger.info("Using markdown provided by crawl4ai")
-            markdown_content = result['markdown']
-        elif result.get('extraction_method') == 'enhanced' and result.get('content'):
+            markdown_content = markdown
+        elif content and result.get('extraction_method') == 'enhanced':
             logger.info("Using enhanced extraction content")
-            markdown_content = self._convert_to_markdown(result['content'])
-        elif result.get('content') and result.get('content') != "Error: No content could be extracted.":
+            markdown_content = self._convert_to_markdown(content)
+        elif content and content != "Error: No content could be extracted.":
             logger.info("Using standard content")
-            markdown_content = self._convert_to_markdown(result['content'])
-        elif result.get('text'):
+            markdown_content = self._convert_to_markdown(content)
+        elif text:
             logger.info("Using plain text content")
-            markdown_content = result.get('text')
-        elif result.get('html'):
+            markdown_content = text
+        elif html:
             logger.info("Attempting HTML to markdown conversion")
-            markdown_content = self._html_to_markdown(result.get('html'))
+            markdown_content = self._html_to_markdown(html)
         
         # If still no content, log error
         if not markdown_content:
@@ -60,11 +168,12 @@ class ContentProcessor:
             markdown_content = "No content could be extracted."
         
         # Extract a title if not already present in the result
-        if not result.get('title') and result.get('html'):
-            result['title'] = self.extract_title_from_html(result.get('html'))
+        if html and not result.get('title'):
+            result['title'] = self.extract_title_from_html(html)
         
-        # Post-process the markdown to improve formatting
-        processed_content = self._post_process_markdown(markdown_content, result)
+        # Post-process the markdown to improve formatting; the HTML title
+        # has just been looked for, so it is not extracted a second time
+        processed_content = self._post_process_markdown(markdown_content, result, html_checked=True)
         
         return processed_content
     
@@ -78,9 +187,15 @@ class ContentProcessor:
         Returns:
             str: Extracted title or empty string if not found
         """
+        if etree is not None:
+            return self._stream_title_from_html(html_content)
+        
+        if BeautifulSoup is None:
+            logger.warning("BeautifulSoup not installed, cannot extract title from HTML")
+            return ""
+        
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER)
             
             # Method 1: Check <title> tag
             if soup.title and soup.title.string:
@@ -106,6 +221,80 @@ class ContentProcessor:
         
         return ""
     
+    def _stream_title_from_html(self, html_content: str) -> str:
+        """
+        Extract the title from HTML content with a streaming parser.
+        
+        Checks the same sources in the same order as the BeautifulSoup
+        version, but stops at the first non-empty <title>, and empties
+        elements once they are read so no full tree is kept.
+        
+        Args:
+            html_content: HTML content string
+            
+        Returns:
+            str: Extracted title or empty string if not found
+        """
+        if not html_content:
+            return ""
+        
+        og_title = h1_text = heading_text = None
+        first_h1 = first_heading = None
+        heading_depth = 0
+        
+        def read_events():
+            nonlocal og_title, h1_text, heading_text, first_h1, first_heading, heading_depth
+            for event, element in parser.read_events():
+                tag = element.tag
+                if event == 'start':
+                    # Candidates are picked in document order, read at their end tag
+                    if tag in _HEADING_TAGS:
+                        heading_depth += 1
+                        if tag == 'h1' and first_h1 is None:
+                            first_h1 = element
+                        elif tag in ('h2', 'h3') and first_heading is None:
+                            first_heading = element
+                    continue
+                
+                if tag in _HEADING_TAGS:
+                    heading_depth -= 1
+                if tag == 'title':
+                    if element.text and element.text.strip():
+                        return element.text.strip()
+                elif tag == 'meta':
+                    if og_title is None and element.get('property') == 'og:title':
+                        og_title = element.get('content') or ''
+                elif element is first_h1:
+                    h1_text = ''.join(element.itertext())
+                elif element is first_heading:
+                    heading_text = ''.join(element.itertext())
+                
+                # Heading text is read at its end tag, so only clear outside headings
+                if not heading_depth:
+                    element.clear(keep_tail=True)
+            return None
+        
+        try:
+            parser = etree.HTMLPullParser(events=('start', 'end'))
+            for start in range(0, len(html_content), _FEED_CHUNK_SIZE):
+                parser.feed(html_content[start:start + _FEED_CHUNK_SIZE])
+                title = read_events()
+                if title:
+                    return title
+            parser.close()
+            title = read_events()
+            if title:
+                return title
+            
+            for candidate in (og_title, h1_text, heading_text):
+                if candidate:
+                    return candidate.strip()
+                    
+        except Exception as e:
+            logger.error(f"Error extracting title from HTML: {str(e)}")
+        
+        return ""
+    
     def _convert_to_markdown(self, content: str) -> str:
         """
         Convert content to markdown if it contains HTML.
@@ -118,8 +307,139 @@ class ContentProcessor:
         """
         # Check if content looks like HTML
         if "<" in content and ">" in content and ("<p>" in content or "<div>" in content or "<a" in content):
+            if len(content) < _SNIPPET_MAX_LENGTH:
+                markdown = self._snippet_to_markdown(content)
+                if markdown is not None:
+                    return markdown
             return self._html_to_markdown(content)
         return content
+    
+    def _snippet_to_markdown(self, html_content: str) -> Optional[str]:
+        """
+        Convert a small HTML fragment to markdown without a full parser.
+        
+        Only handles paragraphs, line breaks, links, emphasis and spans;
+        anything else is left to _html_to_markdown.
+        
+        Args:
+            html_content: Small HTML fragment
+            
+        Returns:
+            Optional[str]: Markdown-formatted content, or None if the
+            fragment uses tags this converter does not handle
+        """
+        # Comments, doctypes and CDATA are left to the full converter
+        if '<!' in html_content:
+            return None
+        
+        # Collapse source whitespace as a browser would
+        collapsed = _SNIPPET_WHITESPACE_RE.sub(' ', html_content)
+        tags = list(_SNIPPET_TAG_RE.finditer(collapsed))
+        if any(match.group(2).lower() not in _SNIPPET_TAGS for match in tags):
+            return None
+        
+        # Text needing markdown escapes is left to the full converter
+        text = unescape(_SNIPPET_TAG_RE.sub(' ', collapsed))
+        if _SNIPPET_MARKDOWN_CHARS_RE.search(text) or _SNIPPET_LIST_MARKER_RE.search(text):
+            return None
+        
+        # Links and emphasis need their start and end tags to pair up, without
+        # nesting the same markup or a paragraph break inside them
+        open_tags = []
+        for index, match in enumerate(tags):
+            closing, name, _ = match.groups()
+            name = name.lower()
+            if name in ('p', 'div') and open_tags:
+                return None
+            if name not in _SNIPPET_PAIRED_TAGS:
+                continue
+            if name != 'a' and not self._snippet_emphasis_delimited(collapsed, tags, index):
+                return None
+            if closing:
+                if not open_tags or open_tags.pop() != name:
+                    return None
+            elif any(_SNIPPET_PAIRED_TAGS[tag] == _SNIPPET_PAIRED_TAGS[name] for tag in open_tags):
+                return None
+            else:
+                open_tags.append(name)
+        if open_tags:
+            return None
+        
+        def convert_tag(match):
+            closing, name, attrs = match.groups()
+            name = name.lower()
+            if name in ('p', 'div'):
+                return '\n\n'
+            if name == 'br':
+                return '  \n'
+            if name in ('b', 'strong'):
+                return '**'
+            if name in ('i', 'em'):
+                return '_'
+            if name == 'a':
+                # Anchors without an href are kept as plain text
+                if closing:
+                    href = hrefs.pop()
+                    return f']({href})' if href is not None else ''
+                href = _SNIPPET_HREF_RE.search(attrs)
+                if href is None:
+                    hrefs.append(None)
+                    return ''
+                hrefs.append(unescape(next(g for g in href.groups() if g is not None)))
+                return '['
+            return ''
+        
+        hrefs = []
+        markdown = unescape(_SNIPPET_TAG_RE.sub(convert_tag, collapsed))
+        markdown = _SNIPPET_BLANK_LINES_RE.sub('\n\n', markdown)
+        markdown = _SNIPPET_LINE_START_RE.sub('\n', markdown).strip() + '\n'
+        
+        # Lines that would read as lists, headings or quotes, and links that
+        # would read as images, need escapes
+        if _SNIPPET_BLOCK_MARKER_RE.search(markdown) or '![' in markdown:
+            return None
+        return markdown
+    
+    @staticmethod
+    def _snippet_emphasis_delimited(collapsed: str, tags: list, index: int) -> bool:
+        """
+        Whether an emphasis tag can become a markdown marker as it stands.
+        
+        The marker must touch the text it wraps and be set apart from the
+        text around it, or markdown would not read it as emphasis.
+        
+        Args:
+            collapsed: Whitespace-collapsed HTML fragment
+            tags: Tag matches in the fragment
+            index: Index of the emphasis tag in `tags`
+            
+        Returns:
+            bool: True if the tag can be converted directly
+        """
+        match = tags[index]
+        if match.group(1):
+            inside = collapsed[match.start() - 1:match.start()]
+            outside = collapsed[match.end():match.end() + 1]
+            neighbour = tags[index + 1] if index + 1 < len(tags) else None
+            touches = neighbour is not None and neighbour.start() == match.end()
+        else:
+            inside = collapsed[match.end():match.end() + 1]
+            outside = collapsed[match.start() - 1:match.start()] if match.start() else ''
+            neighbour = tags[index - 1] if index else None
+            touches = neighbour is not None and neighbour.end() == match.start()
+        
+        if not inside or inside.isspace() or inside in '<>':
+            return False
+        if not outside or outside.isspace():
+            return True
+        if not touches:
+            return False
+        # A paragraph or line break may sit right against the marker, and so
+        # may the bracket of a link the emphasis fills
+        name = neighbour.group(2).lower()
+        if name == 'a':
+            return bool(neighbour.group(1)) == bool(match.group(1))
+        return name in _SNIPPET_BLOCK_TAGS
 
     def _html_to_markdown(self, html_content: str) -> str:
         """
@@ -133,46 +453,69 @@ class ContentProcessor:
         """
         logger.debug("Converting HTML to markdown")
         
+        key = _content_key(html_content)
+        cached = self._html_cache.get(key)
+        if cached is not None:
+            self._html_cache.move_to_end(key)
+            return cached
+        
+        return self._remember(self._html_cache, key, self._convert_html(html_content))
+    
+    def _convert_html(self, html_content: str) -> str:
+        """
+        Convert HTML content to markdown with the best available converter.
+        
+        Args:
+            html_content: HTML string
+            
+        Returns:
+            str: Markdown-formatted content
+        """
         try:
+            # Prefer the native html-to-markdown converter if available
+            if html_to_markdown is not None:
+                try:
+                    converted = html_to_markdown.convert(html_content, self._md_options)
+                    # Newer releases return a result object, older ones a string
+                    return getattr(converted, 'content', converted)
+                except Exception as e:
+                    logger.warning(f"html-to-markdown conversion failed, trying html2text: {str(e)}")
+            
             # Try using html2text if available
-            try:
-                import html2text
+            if html2text is not None:
                 h = html2text.HTML2Text()
                 h.ignore_links = False
                 h.ignore_images = False
                 h.body_width = 0  # No wrapping
                 return h.handle(html_content)
-            except ImportError:
-                logger.warning("html2text not installed, trying BeautifulSoup")
+            logger.warning("html2text not installed, trying BeautifulSoup")
                 
             # Fall back to BeautifulSoup for basic conversion
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Remove script and style elements
-                for script_or_style in soup(["script", "style"]):
-                    script_or_style.decompose()
-                
-                # Simple HTML to markdown conversion
-                text = soup.get_text(separator='\n\n', strip=True)
-                
-                return text
-            except ImportError:
+            if BeautifulSoup is None:
                 logger.warning("BeautifulSoup not installed, returning raw content")
                 return html_content
+            
+            soup = BeautifulSoup(html_content, _SOUP_PARSER)
+            
+            # Remove script and style elements
+            for script_or_style in soup(["script", "style"]):
+                script_or_style.decompose()
+            
+            # Simple HTML to markdown conversion
+            return soup.get_text(separator='\n\n', strip=True)
                 
         except Exception as e:
             logger.error(f"HTML to markdown conversion failed: {str(e)}")
             return html_content  # Return original content if conversion fails
     
-    def _post_process_markdown(self, markdown: str, result: Dict[str, Any]) -> str:
+    def _post_process_markdown(self, markdown: str, result: Dict[str, Any], html_checked: bool = False) -> str:
         """
         Perform post-processing on the markdown content.
         
         Args:
             markdown: Original markdown content
             result: Dictionary containing the crawl result
+            html_checked: Whether the result's HTML was already searched for a title
             
         Returns:
             str: Improved markdown content
@@ -180,18 +523,21 @@ class ContentProcessor:
         logger.debug("Post-processing markdown content")
         
         # Extract title with fallback mechanisms
-        title = self._extract_title(result)
+        title = self._extract_title(result, html_checked)
         url = result.get('url', '')
         timestamp = result.get('timestamp', '')
         
-        header = f"# {title}\n\n"
-        metadata = f"_Source: {url}_  \n"
-        if timestamp:
-            metadata += f"_Crawled: {timestamp}_  \n"
-        metadata += "\n---\n\n"
+        crawled = f"_Crawled: {timestamp}_  \n" if timestamp else ""
         
-        # Combine with original content
-        processed_content = header + metadata + markdown
+        # Header, metadata and original content, built in one step
+        processed_content = f"# {title}\n\n_Source: {url}_  \n{crawled}\n---\n\n{markdown}"
+        
+        # Reuse the result if this exact document was processed recently
+        key = _content_key(processed_content)
+        cached = self._markdown_cache.get(key)
+        if cached is not None:
+            self._markdown_cache.move_to_end(key)
+            return cached
         
         # Ensure tables are properly formatted
         processed_content = self._improve_tables(processed_content)
@@ -199,20 +545,18 @@ class ContentProcessor:
         # Fix heading levels (ensure proper hierarchy)
         processed_content = self._fix_heading_levels(processed_content)
         
-        # Handle image references
-        processed_content = self._process_images(processed_content)
-        
         # Fix links
         processed_content = self._fix_links(processed_content)
         
-        return processed_content
+        return self._remember(self._markdown_cache, key, processed_content)
     
-    def _extract_title(self, result: Dict[str, Any]) -> str:
+    def _extract_title(self, result: Dict[str, Any], html_checked: bool = False) -> str:
         """
         Extract the title with improved fallback mechanisms.
         
         Args:
             result: Dictionary containing the crawled content
+            html_checked: Whether the result's HTML was already searched for a title
             
         Returns:
             str: Extracted title
@@ -221,14 +565,14 @@ class ContentProcessor:
         if result.get('title'):
             return result.get('title')
         
-        # Try to extract from HTML if available
-        if result.get('html'):
+        # Try to extract from HTML if available and not already tried
+        if not html_checked and result.get('html'):
             title = self.extract_title_from_html(result.get('html'))
             if title:
                 return title
         
         # Extract from URL if still no title
-        parsed_url = urlparse(result.get('url', ''))
+        parsed_url = split_url(result.get('url', ''))
         path_parts = parsed_url.path.split('/')
         path_parts = [p for p in path_parts if p]
         
@@ -261,43 +605,63 @@ class ContentProcessor:
         """
         logger.debug("Improving table formatting")
         
-        # Check if content contains tables
-        if '|' not in content or '\n|' not in content:
+        # Check if content contains tables: a table needs a row ending in '|'
+        # directly followed by a line starting with '|' (header, then separator)
+        if '|\n|' not in content:
             return content
             
-        # Simple table alignment fix
-        # Find all table sections (multiline starting with | and ending with empty line)
-        table_pattern = r'(\n\|[^\n]+\|\n\|[-:| ]+\|\n(?:\|[^\n]+\|\n)+)'
-        
-        def format_table(match):
-            table = match.group(1)
-            lines = table.split('\n')
-            
-            # Process the table
-            formatted_lines = []
-            for line in lines:
-                if not line:
-                    continue
-                
-                # Skip separator line (---|---|---)
-                if line.startswith('|') and all(c in '|-:' for c in line.strip('|')):
-                    formatted_lines.append(line)
+        # Single pass over the lines: a table is a header row, a separator
+        # row and one or more body rows, each a '|...|' line ending in a newline
+        lines = ('\n' + content).split('\n')
+        last = len(lines) - 1
+        output = [lines[0]]
+        i = 1
+        while i < last:
+            if (i + 1 < last and self._is_table_row(lines[i])
+                    and self._is_table_separator(lines[i + 1])):
+                end = i + 2
+                while end < last and self._is_table_row(lines[end]):
+                    end += 1
+                if end > i + 2:
+                    # The formatted table is joined onto the preceding line
+                    output[-1] += self._format_table_line(lines[i])
+                    output.extend(self._format_table_line(line) for line in lines[i + 1:end])
+                    # The line after a table cannot start another one
+                    output.append(lines[end])
+                    i = end + 1
                     continue
-                    
-                # Format content lines
-                if line.startswith('|') and line.endswith('|'):
-                    cells = [cell.strip() for cell in line.strip('|').split('|')]
-                    formatted_line = '| ' + ' | '.join(cells) + ' |'
-                    formatted_lines.append(formatted_line)
-                else:
-                    formatted_lines.append(line)
-            
-            return '\n'.join(formatted_lines) + '\n'
-            
-        # Replace tables with formatted ones
-        improved_content = re.sub(table_pattern, format_table, '\n' + content)
+            output.append(lines[i])
+            i += 1
+        output.extend(lines[i:])
         
-        return improved_content.lstrip('\n')
+        return '\n'.join(output).lstrip('\n')
+    
+    @staticmethod
+    def _is_table_row(line: str) -> bool:
+        """Whether a line is a '|...|' table row."""
+        return len(line) > 2 and line[0] == '|' and line[-1] == '|'
+    
+    @staticmethod
+    def _is_table_separator(line: str) -> bool:
+        """Whether a line is a table separator row, e.g. '|---|:--:|'."""
+        return ContentProcessor._is_table_row(line) and _TABLE_SEPARATOR_CHARS.issuperset(line)
+    
+    @staticmethod
+    def _format_table_line(line: str) -> str:
+        """
+        Normalize the cell padding of one table line.
+        
+        Args:
+            line: A table row or separator line
+            
+        Returns:
+            str: The formatted line
+        """
+        # Keep separator lines (---|---|---) as they are
+        if all(c in '|-:' for c in line.strip('|')):
+            return line
+        cells = [cell.strip() for cell in line.strip('|').split('|')]
+        return '| ' + ' | '.join(cells) + ' |'
     
     def _fix_heading_levels(self, content: str) -> str:
         """
@@ -311,48 +675,24 @@ class ContentProcessor:
         """
         logger.debug("Fixing heading levels")
         
+        # With no heading marker after the first line, only a leading
+        # '# Title' or '##...' could match, and neither is changed
+        if '\n#' not in content and (not content.startswith('#') or content.startswith(('# ', '##'))):
+            return content
+        
         # We've already added a level 1 heading for the title,
         # so we need to ensure subsequent headings are properly nested
-        
-        # Split by lines to process headings
-        lines = content.split('\n')
         title_done = False
         
-        for i in range(len(lines)):
-            # Skip the first heading (title)
-            if not title_done and lines[i].startswith('# '):
+        def demote(match):
+            nonlocal title_done
+            # Skip the first heading (title), demote other h1s to h2
+            if not title_done and match.group(1):
                 title_done = True
-                continue
-                
-            # Process other headings: h1->h2, h2->h3, etc.
-            if lines[i].startswith('#'):
-                heading_level = 0
-                for char in lines[i]:
-                    if char == '#':
-                        heading_level += 1
-                    else:
-                        break
-                
-                # Ensure no heading is higher than h2 (we've already used h1 for title)
-                if heading_level == 1:
-                    lines[i] = '#' + lines[i]  # h1 -> h2
-                
-        return '\n'.join(lines)
-    
-    def _process_images(self, content: str) -> str:
-        """
-        Process image references in the markdown.
+                return match.group(0)
+            return '#' + match.group(0)
         
-        Args:
-            content: Markdown content
-            
-        Returns:
-            str: Markdown with processed image references
-        """
-        logger.debug("Processing image references")
-        
-        # Most likely already handled by crawl4ai, but we can add specific logic if needed
-        return content
+        return _H1_RE.sub(demote, content)
     
     def _fix_links(self, content: str) -> str:
         """
@@ -366,8 +706,11 @@ class ContentProcessor:
         """
         logger.debug("Fixing links")
         
+        # Only documents with links need the link pattern
+        if '](' not in content:
+            return content
+        
         # Ensure links have a space after them to prevent formatting issues
-        link_pattern = r'\[(.*?)\]\((.*?)\)([^\s)])'
-        fixed_content = re.sub(link_pattern, r'[\1](\2)\3', content)
+        fixed_content = _LINK_RE.sub(r'[\1](\2) ', content)
         
         return fixed_content
\ No newline at end of file
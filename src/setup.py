@@ -9,11 +9,34 @@ import sys
 import logging
 import subprocess
 import json
-import pkg_resources
-from typing import List, Dict
+import re
+from pathlib import Path
+from importlib.metadata import version, PackageNotFoundError
+from typing import List, Dict, Tuple, Union
+
+try:
+    from packaging.version import Version
+except ImportError:
+    Version = None
 
 logger = logging.getLogger(__name__)
 
+def _parse_version(value: str) -> Union["Version", Tuple[int, ...]]:
+    """
+    Parse a version string into a comparable value.
+    
+    Args:
+        value: Version string, e.g. "0.10.0"
+        
+    Returns:
+        A packaging Version if packaging is installed, otherwise a tuple
+        of the release numbers
+    """
+    if Version is not None:
+        return Version(value)
+    release = re.match(r'\d+(?:\.\d+)*', value)
+    return tuple(int(part) for part in release.group(0).split('.')) if release else ()
+
 def check_dependencies() -> bool:
     """
     Check if all required dependencies are installed.
@@ -32,13 +55,13 @@ def check_dependencies() -> bool:
     for package, min_version in required.items():
         try:
             # Check if the package is installed
-            pkg_version = pkg_resources.get_distribution(package).version
+            pkg_version = version(package)
             
-            # Compare versions (simplified)
-            if pkg_version < min_version:
+            # Compare versions numerically, not as strings
+            if _parse_version(pkg_version) < _parse_version(min_version):
                 missing.append(f"{package}>={min_version}")
                 
-        except pkg_resources.DistributionNotFound:
+        except PackageNotFoundError:
             missing.append(f"{package}>={min_version}")
     
     if missing:
@@ -64,7 +87,11 @@ def install_dependencies(dependencies: List[str]) -> bool:
     logger.info(f"Installing dependencies: {', '.join(dependencies)}")
     
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + dependencies)
+        # No version self-check (a network round-trip) and never prompt
+        subprocess.check_call(
+            [sys.executable, '-m', 'pip', 'install',
+             '--disable-pip-version-check', '--no-input', '--quiet'] + dependencies
+        )
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to install dependencies: {e}")
@@ -77,13 +104,13 @@ def setup_config_directory() -> str:
     Returns:
         str: Path to the configuration directory
     """
-    config_dir = os.path.join(os.path.expanduser("~"), ".web_scraper")
-    os.makedirs(config_dir, exist_ok=True)
+    config_dir = Path.home() / ".web_scraper"
+    config_dir.mkdir(parents=True, exist_ok=True)
     
     # Create default configuration file if it doesn't exist
-    config_file = os.path.join(config_dir, "config.json")
+    config_file = config_dir / "config.json"
     
-    if not os.path.exists(config_file):
+    if not config_file.exists():
         default_config = {
             "output_directory": os.path.join(os.getcwd(), "scraped_content"),
             "default_timeout": 30,
@@ -93,38 +120,37 @@ def setup_config_directory() -> str:
             "user_agent": "Web Scraper with crawl4ai/0.1.0"
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        config_file.write_text(json.dumps(default_config, indent=2))
             
         logger.info(f"Created default configuration at {config_file}")
     
     # Create credentials file if it doesn't exist
-    creds_file = os.path.join(config_dir, "credentials.json")
+    creds_file = config_dir / "credentials.json"
     
-    if not os.path.exists(creds_file):
+    if not creds_file.exists():
         default_creds = {
             "sites": {}
         }
         
-        with open(creds_file, 'w') as f:
-            json.dump(default_creds, f, indent=2)
+        creds_file.write_text(json.dumps(default_creds, indent=2))
             
         logger.info(f"Created default credentials file at {creds_file}")
     
-    return config_dir
+    return str(config_dir)
 
 def create_project_structure() -> None:
     """
     Create the project directory structure.
     """
     # Directories to create
+    cwd = Path.cwd()
     directories = [
-        os.path.join(os.getcwd(), "scraped_content"),
-        os.path.join(os.getcwd(), "logs")
+        cwd / "scraped_content",
+        cwd / "logs"
     ]
     
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        directory.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created directory: {directory}")
 
 def check_crawl4ai_installation() -> bool:
@@ -0,0 +1,48 @@
+"""
+URL Patterns module for the Web Scraper
+
+This module holds the helpers used to classify URLs and a cached URL
+splitter shared across the pipeline.
+"""
+
+from functools import lru_cache
+from urllib.parse import SplitResult, urlsplit
+
+def is_confluence(url: str) -> bool:
+    """
+    Check whether a URL points to a Confluence site.
+
+    Args:
+        url: The URL to check
+
+    Returns:
+        bool: True if the URL looks like a Confluence URL
+    """
+    # Plain substring tests on the lowercased URL (host or path)
+    url = url.lower()
+    return 'confluence' in url or 'atlassian.net' in url
+
+@lru_cache(maxsize=256)
+def split_url(url: str) -> SplitResult:
+    """
+    Split a URL into its components, reusing the result for repeated URLs.
+
+    Args:
+        url: The URL to split
+
+    Returns:
+        SplitResult: The scheme, netloc, path, query and fragment
+    """
+    return urlsplit(url)
+
+def url_netloc(url: str) -> str:
+    """
+    Get the network location (host and port) of a URL.
+
+    Args:
+        url: The URL
+
+    Returns:
+        str: The netloc component
+    """
+    return split_url(url).netloc
@@ -6,11 +6,20 @@ This script checks:
 1. If the 'scrapemd' command is available in PATH
 2. If it returns the expected help output
 3. If it can handle basic error cases properly
+
+Only the first check runs the installed binary; the others call the CLI's
+argument parser in-process, which avoids a Python start-up per check.
 """
 
+import io
 import subprocess
 import sys
 import os
+from contextlib import redirect_stdout, redirect_stderr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from cli import parse_arguments
 
 def run_command(cmd):
     """Run a command and return stdout, stderr, and return code."""
@@ -27,8 +36,18 @@ def run_command(cmd):
     except Exception as e:
         return "", str(e), 1
 
+def run_cli(args):
+    """Run the CLI argument parsing in-process and return stdout, stderr, and exit code."""
+    with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()) as err:
+        try:
+            parse_arguments(args)
+            return_code = 0
+        except SystemExit as e:
+            return_code = e.code
+    return out.getvalue(), err.getvalue(), return_code
+
 def test_command_existence():
-    """Test if scrapemd command exists in PATH."""
+    """Smoke test that the installed scrapemd command exists in PATH."""
     print("Testing if 'scrapemd' command is available...")
     
     # Try to run the help command
@@ -50,7 +69,7 @@ def test_help_output():
     """Test if the help output contains expected information."""
     print("\nTesting help output...")
     
-    stdout, stderr, return_code = run_command("scrapemd --help")
+    stdout, stderr, return_code = run_cli(["--help"])
     
     # Check for expected content in help
     expected_elements = [
@@ -77,13 +96,13 @@ def test_error_handling():
     print("\nTesting error handling...")
     
     # Test missing URL argument
-    stdout, stderr, return_code = run_command("scrapemd")
+    stdout, stderr, return_code = run_cli([])
     if return_code == 0:
         print("❌ Command should fail when URL is missing")
         return False
     
     # Test invalid URL format
-    stdout, stderr, return_code = run_command("scrapemd --url invalid-url")
+    stdout, stderr, return_code = run_cli(["--url", "invalid-url"])
     if return_code == 0:
         print("❌ Command should fail with invalid URL format")
         return False
@@ -2,4 +2,13 @@
 Web Scraper with crawl4ai - Tests Package
 
 This package contains tests for the web scraper application.
-"""
\ No newline at end of file
+"""
+
+import os
+import sys
+
+# The modules under test import each other by bare name, as they are
+# installed as top-level modules; make them importable from a checkout
+_SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
@@ -5,23 +5,20 @@ Tests for the FileManager module.
 import os
 import unittest
 import tempfile
-import shutil
-from src.file_manager import FileManager
+from pathlib import Path
+from pyfakefs import fake_filesystem_unittest
+from file_manager import FileManager
 
-class TestFileManager(unittest.TestCase):
+class TestFileManager(fake_filesystem_unittest.TestCase):
     """Test cases for the FileManager class."""
     
     def setUp(self):
         """Set up test environment."""
-        # Create a temporary directory for test output
+        # Output goes to an in-memory filesystem, discarded after each test
+        self.setUpPyfakefs()
         self.test_dir = tempfile.mkdtemp()
         self.file_manager = FileManager(self.test_dir)
         
-    def tearDown(self):
-        """Clean up after tests."""
-        # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
-        
     def test_sanitize_filename(self):
         """Test filename sanitization."""
         # Test with various inputs
@@ -36,9 +33,11 @@ class TestFileManager(unittest.TestCase):
             ("Name.with.dots...", "Name.with.dots"),  # Trailing dots
         ]
         
+        # Each case is reported on its own, and a failure does not stop the rest
         for input_name, expected in test_cases:
-            result = self.file_manager._sanitize_filename(input_name)
-            self.assertEqual(result, expected)
+            with self.subTest(input_name=input_name):
+                result = self.file_manager._sanitize_filename(input_name)
+                self.assertEqual(result, expected)
             
     def test_create_output_dir(self):
         """Test creation of output directory structure."""
@@ -77,8 +76,7 @@ class TestFileManager(unittest.TestCase):
         self.assertTrue(os.path.exists(output_path))
         
         # Check the content was saved correctly
-        with open(output_path, 'r', encoding='utf-8') as f:
-            saved_content = f.read()
+        saved_content = Path(output_path).read_text(encoding='utf-8')
             
         self.assertEqual(saved_content, content)
         
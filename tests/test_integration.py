@@ -6,57 +6,67 @@ import os
 import unittest
 import asyncio
 import tempfile
-import shutil
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+from pyfakefs import fake_filesystem_unittest
 
-from src.cli import parse_arguments
-from src.crawler import Crawler
-from src.processor import ContentProcessor
-from src.file_manager import FileManager
+from crawler import Crawler
+from processor import ContentProcessor
+from file_manager import FileManager
 
-class TestIntegration(unittest.TestCase):
+# Command line arguments for the workflow test; the output directory is set per test
+_ARGS_TEMPLATE = {
+    'url': "https://example.com",
+    'output': None,
+    'depth': 1,
+    'timeout': 30,
+    'username': None,
+    'password': None,
+    'confluence': False,
+    'space': None,
+    'page_id': None,
+    'verbose': False,
+}
+
+# Crawl result returned by the mocked crawler; like crawl4ai's CrawlResult,
+# its content is read through attributes
+_MOCK_RESULT = SimpleNamespace(
+    markdown='# Example Domain\n\nThis domain is for use in illustrative examples in documents.',
+    html='<html><head><title>Example Domain</title></head><body><h1>Example Domain</h1></body></html>',
+    success=True
+)
+
+class TestIntegration(fake_filesystem_unittest.TestCase):
     """Integration test cases for the Web Scraper application."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mocked browser shared by all tests."""
+        super().setUpClass()
+        cls.mock_instance = MagicMock()
+        cls.mock_instance.arun = AsyncMock(return_value=_MOCK_RESULT)
+    
     def setUp(self):
         """Set up test environment."""
-        # Create a temporary directory for test output
+        # Each test sees the shared browser mock without earlier calls
+        self.mock_instance.reset_mock()
+        
+        # Output goes to an in-memory filesystem, discarded after each test
+        self.setUpPyfakefs()
         self.test_dir = tempfile.mkdtemp()
         
         # Mock command line arguments
         self.test_url = "https://example.com"
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
     
-    @patch('argparse.ArgumentParser.parse_args')
-    @patch('src.crawler.AsyncWebCrawler')
-    async def test_end_to_end_workflow(self, mock_crawler_class, mock_parse_args):
+    @patch('crawler.AsyncWebCrawler')
+    async def test_end_to_end_workflow(self, mock_crawler_class):
         """Test the end-to-end workflow of the application."""
-        # Mock command line arguments
-        mock_args = MagicMock()
-        mock_args.url = self.test_url
-        mock_args.output = self.test_dir
-        mock_args.depth = 1
-        mock_args.timeout = 30
-        mock_args.username = None
-        mock_args.password = None
-        mock_args.confluence = False
-        mock_args.space = None
-        mock_args.page_id = None
-        mock_args.verbose = False
-        mock_parse_args.return_value = mock_args
+        # Command line arguments
+        mock_args = SimpleNamespace(**{**_ARGS_TEMPLATE, 'url': self.test_url, 'output': self.test_dir})
         
-        # Mock the crawler response
-        mock_instance = MagicMock()
-        mock_crawler_class.return_value.__aenter__.return_value = mock_instance
-        mock_instance.arun.return_value = {
-            'title': 'Example Domain',
-            'url': self.test_url,
-            'markdown': '# Example Domain\n\nThis domain is for use in illustrative examples in documents.',
-            'timestamp': '2025-03-05 04:00:00'
-        }
+        # The crawler enters AsyncWebCrawler() and crawls with what __aenter__ returns
+        mock_crawler_class.return_value.__aenter__.return_value = self.mock_instance
         
         # Initialize components
         crawler = Crawler(mock_args)
@@ -64,7 +74,10 @@ class TestIntegration(unittest.TestCase):
         file_manager = FileManager(mock_args.output)
         
         # Execute the workflow
-        result = await crawler.crawl(mock_args.url)
+        try:
+            result = await crawler.crawl(mock_args.url)
+        finally:
+            await crawler.aclose()
         markdown_content = processor.process(result)
         output_path = file_manager.save(markdown_content, 'example.com', 'Example Domain')
         
@@ -72,24 +85,18 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(os.path.exists(output_path))
         
         # Read the output file and verify its contents
-        with open(output_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(output_path).read_text(encoding='utf-8')
             
         # Check that the content contains expected elements
         self.assertIn('# Example Domain', content)
         self.assertIn('_Source: https://example.com_', content)
         self.assertIn('This domain is for use in illustrative examples in documents', content)
+        self.mock_instance.arun.assert_awaited_once_with(url=self.test_url)
 
 # Helper function to run async tests
 def async_test(coro):
     def wrapper(*args, **kwargs):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro(*args, **kwargs))
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
+        return asyncio.run(coro(*args, **kwargs))
     return wrapper
 
 # Replace the test methods with the async_test decorator
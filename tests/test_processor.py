@@ -3,14 +3,15 @@ Tests for the ContentProcessor module.
 """
 
 import unittest
-from src.processor import ContentProcessor
+from processor import ContentProcessor
 
 class TestContentProcessor(unittest.TestCase):
     """Test cases for the ContentProcessor class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.processor = ContentProcessor()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one processor shared by all tests."""
+        cls.processor = ContentProcessor()
         
     def test_post_process_markdown(self):
         """Test post-processing of markdown content."""
@@ -41,6 +42,19 @@ class TestContentProcessor(unittest.TestCase):
         self.assertIn("* List item 1", processed)
         self.assertIn("* List item 2", processed)
         
+    def test_process_html_page_has_single_front_matter(self):
+        """Test converted pages carry no metadata block of their own."""
+        html = ('<html><head><title>T</title><meta name="description" content="D"></head>'
+                '<body><h1>Hi</h1><p>Some text for the page body.</p></body></html>')
+        
+        processed = self.processor.process({'html': html, 'url': 'https://example.com/page'})
+        
+        self.assertTrue(processed.startswith('# T\n'))
+        self.assertNotIn('title: T', processed)
+        self.assertNotIn('meta-description', processed)
+        self.assertEqual(processed.count('---'), 1)
+        self.assertIn('Some text for the page body.', processed)
+        
     def test_improve_tables(self):
         """Test table formatting improvements."""
         # Simple table in markdown
@@ -124,6 +138,60 @@ And [one more](https://example.net) with proper spacing.
         self.assertIn("[another link](https://example.org) with the same issue", processed)
         self.assertIn("[one more](https://example.net) with proper spacing", processed)
     
+    def test_convert_small_snippet(self):
+        """Test conversion of small HTML fragments without a full parser."""
+        html = '<p>See <a href="https://example.com/?a=1&amp;b=2">the <b>docs</b></a></p><p>Line<br>break</p>'
+        
+        processed = self.processor._convert_to_markdown(html)
+        
+        self.assertEqual(processed, "See [the **docs**](https://example.com/?a=1&b=2)\n\nLine  \nbreak\n")
+        
+        # Fragments with other tags are left to the full converter
+        self.assertIsNone(self.processor._snippet_to_markdown("<p>Text</p><table></table>"))
+        
+        # Comments are not copied through to the markdown
+        self.assertIsNone(self.processor._snippet_to_markdown("<p>Hi<!-- note --> there</p>"))
+        
+        # Unbalanced emphasis would leave dangling markers
+        for html in ("<p>a<b>b</p>", "<p><em>a</p>", "<p>a</i></p>", "<p><b>a</i></b></p>"):
+            with self.subTest(html=html):
+                self.assertIsNone(self.processor._snippet_to_markdown(html))
+        
+        # Balanced emphasis inside a link is still converted directly
+        self.assertEqual(
+            self.processor._snippet_to_markdown('<p><a href="/x"><em>a</em></a> <strong>b</strong></p>'),
+            "[_a_](/x) **b**\n"
+        )
+
+        # Text that would need markdown escaping, and emphasis that markdown
+        # would not read as such, goes through the full converter
+        for html, expected in (
+            ("<p>1. Not a list</p>", "1\\. Not a list"),
+            ("<p>- Not a list</p>", "\\- Not a list"),
+            ("<p>+ Not a list</p>", "\\+ Not a list"),
+            ("<p>a<b>bold</b>c</p>", "**bold**"),
+            ("<p>Use <i>foo</i>_bar</p>", "_bar"),
+        ):
+            with self.subTest(html=html):
+                self.assertIsNone(self.processor._snippet_to_markdown(html))
+                self.assertIn(expected, self.processor._convert_to_markdown(html))
+
+        # Only the href attribute itself gives the link target
+        self.assertEqual(
+            self.processor._snippet_to_markdown('<p><a data-href="/bad" href="/good">x</a></p>'),
+            "[x](/good)\n"
+        )
+
+    def test_large_documents_not_cached(self):
+        """Test only documents below the size limit are kept in the cache."""
+        processor = ContentProcessor()
+        result = {'title': 'T', 'url': 'https://example.com/'}
+        
+        processor._post_process_markdown("Small page.\n", result)
+        processor._post_process_markdown("x" * (300 * 1024), result)
+        
+        self.assertEqual(len(processor._markdown_cache), 1)
+    
     def _processor_post_process_markdown(self, markdown, result):
         """
         Helper method to directly call the post-processing method.